@@ -9,7 +9,7 @@ import sys
 import threading
 from inspect import getsource
 from pathlib import Path
-from typing import Callable, Dict, List, Optional, Union
+from typing import Callable, Dict, List, Optional, Tuple, Union
 
 import pandas as pd
 from pandas import DataFrame
@@ -23,7 +23,13 @@ from zeno.api import (
     ZenoParameters,
 )
 from zeno.classes.base import DataProcessingReturn, MetadataType, ZenoColumnType
-from zeno.classes.classes import MetricKey, PlotRequest, TableRequest, ZenoColumn
+from zeno.classes.classes import (
+    MetricKey,
+    PlotRequest,
+    StatusResponse,
+    TableRequest,
+    ZenoColumn,
+)
 from zeno.classes.report import Report
 from zeno.classes.slice import FilterIds, FilterPredicateGroup, GroupMetric, Slice
 from zeno.classes.tag import Tag, TagMetricKey
@@ -47,8 +53,46 @@ class ZenoBackend(object):
     def __init__(self, args: ZenoParameters):
         logging.basicConfig(level=logging.INFO)
         self.params = args
+        self.__status = ""
+        self.__status_version = 0
+        self.__status_lock = threading.Lock()
+        self.__status_listeners: List[Callable[[], None]] = []
         self.initial_setup()
 
+    @property
+    def status(self) -> str:
+        return self.__status
+
+    @status.setter
+    def status(self, status: str):
+        with self.__status_lock:
+            if status != self.__status:
+                self.__status = status
+                self.__status_version += 1
+        for listener in list(self.__status_listeners):
+            listener()
+
+    def add_status_listener(self, listener: Callable[[], None]):
+        """Register a callback to run whenever the processing status changes.
+        Listeners can be called from the processing thread."""
+        self.__status_listeners.append(listener)
+
+    def remove_status_listener(self, listener: Callable[[], None]):
+        if listener in self.__status_listeners:
+            self.__status_listeners.remove(listener)
+
+    def get_status_json(self) -> Tuple[int, str]:
+        """Return the status version and a serialized StatusResponse.
+        The version only changes when the status does, so callers can skip
+        sending updates they have already sent."""
+        with self.__status_lock:
+            version, status = self.__status_version, self.__status
+        return version, StatusResponse(
+            status=status,
+            done_processing=self.done_running_inference,
+            complete_columns=list(self.complete_columns),
+        ).json(by_alias=True)
+
     def initial_setup(self) -> None:
         self.metadata = self.params.metadata
         self.functions = self.params.functions
@@ -86,8 +130,9 @@ class ZenoBackend(object):
             Callable[[str], Callable[[DataFrame, ZenoOptions], ModelReturn]]
         ] = None
         self.gradio_input_columns: List[str] = []
+        self.__distill_columns: Dict[Union[str, None], Dict[str, str]] = {}
 
-        self.status: str = "Initializing"
+        self.status = "Initializing"
         self.folders: List[str] = read_pickle("folders.pickle", self.cache_path, [])
         self.reports: List[Report] = read_pickle("reports.pickle", self.cache_path, [])
         self.slices: Dict[str, Slice] = read_pickle(
@@ -224,6 +269,7 @@ class ZenoBackend(object):
                         model=m,
                     )
                 )
+        self.__distill_columns = {}
 
         self.__thread = threading.Thread(
             target=asyncio.run, args=(self.__process(),), daemon=True
@@ -531,48 +577,34 @@ class ZenoBackend(object):
             )
             output_hash = str(output_col)
 
-            distill_fns = [
-                c
-                for c in self.columns
-                if (
-                    c.column_type == ZenoColumnType.PREDISTILL
-                    or c.column_type == ZenoColumnType.POSTDISTILL
-                )
-                and c.model == model
-            ]
-
             local_ops = self.zeno_options.copy(
                 update={
                     "output_column": output_hash,
                     "output_path": os.path.join(self.cache_path, output_hash),
-                    "distill_columns": dict(
-                        zip(
-                            [c.name for c in distill_fns], [str(c) for c in distill_fns]
-                        )
-                    ),
+                    "distill_columns": dict(self.__get_distill_columns(model)),
                 }
             )
         else:
-            distill_fns = [
-                c
+            local_ops = self.zeno_options.copy(
+                update={"distill_columns": dict(self.__get_distill_columns(None))}
+            )
+
+        return self.metric_functions[metric](df, local_ops).metric
+
+    def __get_distill_columns(self, model: Union[str, None]) -> Dict[str, str]:
+        """Map distill function names to column names, cached per model since
+        metrics are calculated many times for each histogram and slice."""
+        if model not in self.__distill_columns:
+            self.__distill_columns[model] = {
+                c.name: str(c)
                 for c in self.columns
                 if (
                     c.column_type == ZenoColumnType.PREDISTILL
                     or c.column_type == ZenoColumnType.POSTDISTILL
                 )
-            ]
-
-            local_ops = self.zeno_options.copy(
-                update={
-                    "distill_columns": dict(
-                        zip(
-                            [c.name for c in distill_fns], [str(c) for c in distill_fns]
-                        )
-                    ),
-                }
-            )
-
-        return self.metric_functions[metric](df, local_ops).metric
+                and (model is None or c.model == model)
+            }
+        return self.__distill_columns[model]
 
     def set_folders(self, folders: List[str]):
         if not self.editable:
@@ -1,4 +1,5 @@
 """Functions for parsing filter predicates and filtering dataframes"""
+import logging
 from typing import List, Optional
 
 import pandas as pd
@@ -8,6 +9,8 @@ from zeno.classes.base import MetadataType, ZenoColumn
 from zeno.classes.metadata import HistogramBucket
 from zeno.classes.slice import FilterIds, FilterPredicate, FilterPredicateGroup
 
+logger = logging.getLogger(__name__)
+
 
 def get_filter_string(filter: FilterPredicateGroup) -> str:
     """Generate a filter string for Pandas query from a nested set of FilterPredicates.
@@ -45,7 +48,7 @@ def get_filter_string(filter: FilterPredicateGroup) -> str:
                 try:
                     filt += filt_string + "== False" if is_not else filt_string
                 except Exception as e:
-                    print("Invalid Regex Error: ", e)
+                    logger.warning("Invalid Regex Error: %s", e)
             else:
                 try:
                     val = str(float(f.value))
@@ -1,4 +1,5 @@
 """Functions for creating the frontend metadata histograms."""
+import logging
 import re
 from math import isnan
 from typing import Callable, List, Union
@@ -10,6 +11,8 @@ from zeno.classes.base import MetadataType, ZenoColumn
 from zeno.classes.metadata import HistogramBucket, HistogramRequest, StringFilterRequest
 from zeno.processing.filtering import filter_table, filter_table_single
 
+logger = logging.getLogger(__name__)
+
 
 def histogram_buckets(
     df: pd.DataFrame, req: List[ZenoColumn], num_bins: Union[int, str] = "doane"
@@ -135,8 +138,16 @@ def histogram_metrics(
     for r in req.column_requests:
         col = r.column
         loc_ret: List[Union[float, None]] = []
-        for b in r.buckets:
-            df_filt = filter_table_single(filt_df, col, b)
+        if (
+            col.metadata_type == MetadataType.NOMINAL
+            or col.metadata_type == MetadataType.BOOLEAN
+        ):
+            # Group the column once instead of scanning it for every bucket.
+            groups = filt_df.groupby(str(col), observed=True).indices
+            bucket_dfs = (filt_df.iloc[groups.get(b.bucket, [])] for b in r.buckets)
+        else:
+            bucket_dfs = (filter_table_single(filt_df, col, b) for b in r.buckets)
+        for df_filt in bucket_dfs:
             metric = metric_fn(df_filt, req.model, req.metric)
             if metric is None or pd.isna(metric) or isnan(metric):
                 loc_ret.append(None)
@@ -186,7 +197,7 @@ def filter_by_string(df: pd.DataFrame, req: StringFilterRequest) -> List[str]:
             query_string = f"`{col_type}`.str.contains(r'{keyword}', flags=@flag)"
             ret = df.query(query_string)[str(col_type)].head().tolist()
         except Exception as e:
-            print("Invalid Regex Error: ", e)
+            logger.warning("Invalid Regex Error: %s", e)
             return short_ret
 
         for r in ret:
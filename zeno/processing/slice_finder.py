@@ -14,13 +14,15 @@ from zeno.util import generate_diff_cols
 
 # Discretize continuous valued columns.
 def cont_cols_df(df, cols: List[str]):
-    new_df = pd.DataFrame()
+    # pd.cut does not modify its input, so read the columns without copying
+    # and build the encoded DataFrame in one go instead of column by column.
+    encoded = {}
     for col in cols:
-        df_col = df.loc[:, col].copy()
+        df_col = df[col]
         bins = list(np.histogram_bin_edges(df_col, bins="doane"))
         bins[0], bins[len(bins) - 1] = bins[0] - 1, bins[len(bins) - 1] + 1
-        new_df.loc[:, col + "_encode"] = pd.cut(df_col, bins=bins)
-    return new_df
+        encoded[col + "_encode"] = pd.cut(df_col, bins=bins)
+    return pd.DataFrame(encoded)
 
 
 def slice_finder(df, req: SliceFinderRequest):
@@ -63,8 +65,18 @@ def slice_finder(df, req: SliceFinderRequest):
 
     cont_search_cols = [col + "_encode" for col in cont_search_cols]
     search_cols_str = not_cont_search_cols + cont_search_cols
+    # Encode all search columns as category codes in one pass, keeping the
+    # categories so discovered slices can be mapped back to column values.
+    search_df = updated_df[search_cols_str].astype("category")
+    search_categories = [search_df[col].cat.categories for col in search_cols_str]
+    # Pass Slicefinder a single contiguous int32 matrix rather than the
+    # DataFrame's column blocks.
+    search_codes = np.ascontiguousarray(
+        search_df.apply(lambda s: s.cat.codes).to_numpy(dtype=np.int32)
+    )
+
     slice_finder = Slicefinder(alpha=req.alpha, k=20, max_l=req.max_lattice)
-    slice_finder.fit(updated_df[search_cols_str].to_numpy(), normalized_metric_col)
+    slice_finder.fit(search_codes, normalized_metric_col)
 
     if slice_finder.top_slices_ is None or slice_finder.top_slices_statistics_ is None:
         return SliceFinderReturn(slices=[], metrics=[], sizes=[], overall_metric=0)
@@ -88,9 +100,15 @@ def slice_finder(df, req: SliceFinderRequest):
 
         slice_sizes.append(slice_finder.top_slices_statistics_[sli_i]["slice_size"])
 
+        # All values come from Slicefinder and are already valid, so skip
+        # pydantic validation when building the predicates and slices. Values
+        # are converted to strings as validating the value field would.
         predicate_list = []
         for pred_i, sli_predicate in enumerate(sli):
             if sli_predicate is not None:
+                sli_predicate = search_categories[pred_i][int(sli_predicate)]
+                if isinstance(sli_predicate, np.generic):
+                    sli_predicate = sli_predicate.item()
                 join_val = "" if len(predicate_list) == 0 else "&"
                 col = search_cols[pred_i]
 
@@ -99,38 +117,38 @@ def slice_finder(df, req: SliceFinderRequest):
                     if str(sli_predicate) in ["True", "False"]:
                         sli_predicate = "true" if sli_predicate else "false"
                     predicate_list.append(
-                        FilterPredicate(
+                        FilterPredicate.construct(
                             column=col,
                             operation="==",
-                            value=sli_predicate,
+                            value=str(sli_predicate),
                             join=join_val,
                         )
                     )
                 # continuous columns
                 else:
-                    left_pred = FilterPredicate(
+                    left_pred = FilterPredicate.construct(
                         column=col,
                         operation=">=",
-                        value=sli_predicate.left,
+                        value=str(float(sli_predicate.left)),
                         join="",
                     )
-                    right_pred = FilterPredicate(
+                    right_pred = FilterPredicate.construct(
                         column=col,
                         operation="<",
-                        value=sli_predicate.right,
+                        value=str(float(sli_predicate.right)),
                         join="&",
                     )
                     predicate_list.append(
-                        FilterPredicateGroup(
+                        FilterPredicateGroup.construct(
                             predicates=[left_pred, right_pred], join=join_val
                         ),
                     )
 
         discovered_slices.append(
-            Slice(
+            Slice.construct(
                 slice_name="Generated Slice " + secrets.token_hex(nbytes=4),
                 folder="",
-                filter_predicates=FilterPredicateGroup(
+                filter_predicates=FilterPredicateGroup.construct(
                     predicates=predicate_list, join=""
                 ),
             )
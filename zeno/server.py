@@ -19,7 +19,6 @@ from zeno.classes.classes import (
     EntryRequest,
     MetricRequest,
     PlotRequest,
-    StatusResponse,
     TableRequest,
     ZenoSettings,
     ZenoVariables,
@@ -227,17 +226,40 @@ def get_server(zeno: ZenoBackend):
     @api_app.websocket("/status")
     async def results_websocket(websocket: WebSocket):
         await websocket.accept()
-        previous_status = ""
-        while True:
-            await asyncio.sleep(1)
-            if zeno.status != previous_status:
-                previous_status = zeno.status
-                await websocket.send_json(
-                    StatusResponse(
-                        status=zeno.status,
-                        done_processing=zeno.done_running_inference,
-                        complete_columns=zeno.complete_columns,
-                    ).json(by_alias=True)
+
+        # Wake up when the backend changes status instead of polling it.
+        loop = asyncio.get_running_loop()
+        status_changed = asyncio.Event()
+        status_changed.set()
+
+        def notify_status_changed():
+            loop.call_soon_threadsafe(status_changed.set)
+
+        async def wait_for_disconnect():
+            while (await websocket.receive())["type"] != "websocket.disconnect":
+                pass
+
+        # Listen for the client closing the socket while waiting for a status
+        # change, so the listener is removed as soon as the client leaves.
+        disconnected = asyncio.ensure_future(wait_for_disconnect())
+        zeno.add_status_listener(notify_status_changed)
+        previous_version = -1
+        try:
+            while True:
+                status_wait = asyncio.ensure_future(status_changed.wait())
+                await asyncio.wait(
+                    [status_wait, disconnected], return_when=asyncio.FIRST_COMPLETED
                 )
+                if disconnected.done():
+                    status_wait.cancel()
+                    break
+                status_changed.clear()
+                version, status_json = zeno.get_status_json()
+                if version != previous_version:
+                    previous_version = version
+                    await websocket.send_json(status_json)
+        finally:
+            disconnected.cancel()
+            zeno.remove_status_listener(notify_status_changed)
 
     return app
@@ -0,0 +1,58 @@
+import pandas as pd
+
+from zeno.classes.base import MetadataType, ZenoColumn, ZenoColumnType
+from zeno.classes.metadata import (
+    HistogramBucket,
+    HistogramColumnRequest,
+    HistogramRequest,
+)
+from zeno.processing.filtering import filter_table_single
+from zeno.processing.histogram_processing import histogram_metrics
+
+
+def sum_metric(df, model, metric):
+    return float(df["value"].sum())
+
+
+def test_histogram_metrics_nominal_and_boolean():
+    test_df = pd.DataFrame(
+        {
+            "number": [1, 2, 3, 1, 2, 1],
+            "flag": [True, False, True, True, False, False],
+            "value": [1.0, 2.0, 4.0, 8.0, 16.0, 32.0],
+        }
+    )
+    number_col = ZenoColumn(
+        column_type=ZenoColumnType.METADATA,
+        name="number",
+        metadata_type=MetadataType.NOMINAL,
+    )
+    flag_col = ZenoColumn(
+        column_type=ZenoColumnType.METADATA,
+        name="flag",
+        metadata_type=MetadataType.BOOLEAN,
+    )
+    # Bucket 4 has no rows. Buckets are coerced to float by validation.
+    number_buckets = [HistogramBucket(bucket=b) for b in [1, 2, 3, 4]]
+    flag_buckets = [HistogramBucket(bucket=True), HistogramBucket(bucket=False)]
+
+    req = HistogramRequest(
+        column_requests=[
+            HistogramColumnRequest(column=number_col, buckets=number_buckets),
+            HistogramColumnRequest(column=flag_col, buckets=flag_buckets),
+        ],
+        metric="sum",
+    )
+
+    expected = [
+        [
+            sum_metric(filter_table_single(test_df, number_col, b), None, "sum")
+            for b in number_buckets
+        ],
+        [
+            sum_metric(filter_table_single(test_df, flag_col, b), None, "sum")
+            for b in flag_buckets
+        ],
+    ]
+    assert histogram_metrics(test_df, sum_metric, req) == expected
+    assert expected == [[41.0, 18.0, 4.0, 0.0], [13.0, 50.0]]
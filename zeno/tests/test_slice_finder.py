@@ -0,0 +1,69 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from zeno.classes.base import MetadataType, ZenoColumn, ZenoColumnType
+from zeno.classes.slice import FilterPredicate, FilterPredicateGroup
+from zeno.classes.slice_finder import SliceFinderRequest
+from zeno.processing.filtering import filter_table
+from zeno.processing.slice_finder import slice_finder
+
+
+def metadata_column(name: str, metadata_type: MetadataType) -> ZenoColumn:
+    return ZenoColumn(
+        column_type=ZenoColumnType.METADATA, name=name, metadata_type=metadata_type
+    )
+
+
+@pytest.fixture()
+def slice_df():
+    rng = np.random.default_rng(0)
+    color = np.array(["a", "b", "c"] * 100)
+    flag = np.array([True, False] * 150)
+    size = rng.uniform(0, 10, 300)
+    error = ((color == "a") & flag).astype(float)
+    return pd.DataFrame({"color": color, "flag": flag, "size": size, "error": error})
+
+
+def test_slice_finder_returns_original_values(slice_df):
+    req = SliceFinderRequest(
+        metric_column=metadata_column("error", MetadataType.CONTINUOUS),
+        search_columns=[
+            metadata_column("color", MetadataType.NOMINAL),
+            metadata_column("flag", MetadataType.BOOLEAN),
+            metadata_column("size", MetadataType.CONTINUOUS),
+        ],
+        order_by="descending",
+        alpha=0.95,
+        max_lattice=3,
+    )
+    res = slice_finder(slice_df, req)
+
+    assert len(res.slices) > 0
+    for sli, size in zip(res.slices, res.sizes):
+        for pred in sli.filter_predicates.predicates:
+            if isinstance(pred, FilterPredicate):
+                if pred.column.name == "color":
+                    assert pred.value in ["a", "b", "c"]
+                else:
+                    assert pred.column.name == "flag"
+                    assert pred.value in ["true", "false"]
+            else:
+                assert isinstance(pred, FilterPredicateGroup)
+                left, right = pred.predicates
+                assert left.column.name == "size" and right.column.name == "size"
+                assert -1 <= float(left.value) < float(right.value) <= 11
+
+        # Predicates mapped back from codes must select the reported rows.
+        assert filter_table(slice_df, sli.filter_predicates).shape[0] == size
+
+    # The rows with errors are exactly color == "a" and flag == True.
+    assert any(
+        {
+            (p.column.name, p.value)
+            for p in sli.filter_predicates.predicates
+            if isinstance(p, FilterPredicate)
+        }
+        == {("color", "a"), ("flag", "true")}
+        for sli in res.slices
+    )
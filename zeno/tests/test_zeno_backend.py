@@ -1,7 +1,10 @@
 import pandas as pd
 import pytest
+from fastapi.testclient import TestClient
 
 from zeno import ZenoOptions, distill, zeno
+from zeno.classes.base import ZenoColumn, ZenoColumnType
+from zeno.server import get_server
 
 
 @distill
@@ -56,3 +59,46 @@ def test_reports(zeno_client):
 
 def test_df(zeno_client):
     assert zeno_client.df.shape == (3, 3)
+
+
+def test_status_json(zeno_client):
+    version, status_json = zeno_client.get_status_json()
+    assert zeno_client.get_status_json() == (version, status_json)
+
+    zeno_client.status = "Done processing"
+    new_version, new_status_json = zeno_client.get_status_json()
+    assert new_version == version + 1
+    assert "Done processing" in new_status_json
+
+    zeno_client.status = "Done processing"
+    assert zeno_client.get_status_json()[0] == new_version
+
+
+def test_status_json_includes_new_columns(zeno_client):
+    version, status_json = zeno_client.get_status_json()
+    zeno_client.complete_columns.append(
+        ZenoColumn(column_type=ZenoColumnType.PREDISTILL, name="new_column")
+    )
+
+    new_version, new_status_json = zeno_client.get_status_json()
+    assert new_version == version
+    assert "new_column" not in status_json
+    assert "new_column" in new_status_json
+
+
+def test_status_websocket(zeno_client):
+    client = TestClient(get_server(zeno_client))
+    with client.websocket_connect("/api/status") as websocket:
+        assert "Initializing" in websocket.receive_json()
+
+        zeno_client.status = "Done processing"
+        assert "Done processing" in websocket.receive_json()
+
+        # Setting the same status again should not push a message, so the
+        # next message is the following status change.
+        zeno_client.status = "Done processing"
+        zeno_client.status = "Running inference"
+        assert "Running inference" in websocket.receive_json()
+
+    # Closing the socket removes its status listener.
+    assert zeno_client._ZenoBackend__status_listeners == []
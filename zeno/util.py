@@ -1,4 +1,5 @@
 import datetime
+import logging
 import os
 import pickle
 import shutil
@@ -19,6 +20,8 @@ from zeno.classes.base import MetadataType, ZenoColumn
 VIEW_MAP_URL: str = "https://raw.githubusercontent.com/zeno-ml/instance-views/0.3/"
 VIEWS_MAP_JSON: str = "views.json"
 
+logger = logging.getLogger(__name__)
+
 
 def read_pickle(file_name: str, cache_path: str, default):
     try:
@@ -143,9 +146,11 @@ def read_config(args: Union[str, Dict, ZenoParameters]) -> ZenoParameters:
                 views_res = requests.get(VIEW_MAP_URL + VIEWS_MAP_JSON)
                 views = views_res.json()
                 url = VIEW_MAP_URL + views[params.view]
-                with open(view_dest_path, "wb") as out_file:
-                    content = requests.get(url, stream=True).content
-                    out_file.write(content)
+                with requests.get(url, stream=True) as res:
+                    res.raise_for_status()
+                    with open(view_dest_path, "wb") as out_file:
+                        for chunk in res.iter_content(chunk_size=65536):
+                            out_file.write(chunk)
             except KeyError:
                 print(
                     "ERROR: View not found in list or relative path."
@@ -257,7 +262,7 @@ def generate_diff_cols(
         diff_col_1.column_type != diff_col_2.column_type
         or diff_col_1.metadata_type != diff_col_2.metadata_type
     ):
-        print("error: different column types!")
+        logger.error("Different column types, cannot generate diff column.")
         return df
 
     # various metadata type difference